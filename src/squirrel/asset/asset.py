@@ -1,7 +1,6 @@
-import errno
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import os
-from pathlib import Path
-import re
 import shutil
 
 from squirrel.shared import libtext
@@ -75,6 +74,23 @@ class Asset(object):
     that symlinks are converted to actual files.
     """
 
+    __slots__ = ("localized_resource_obj",
+                 "asset_n",
+                 "asset_parent_d",
+                 "asset_d",
+                 "data_d",
+                 "thumbnail_data_d",
+                 "metadata_d",
+                 "semaphore_p",
+                 "notes_p",
+                 "log_p",
+                 "config_obj",
+                 "keywords_obj",
+                 "key_values_obj",
+                 "_version_objs",
+                 "_pin_objs",
+                 "_asset_d_scan")
+
     # ------------------------------------------------------------------------------------------------------------------
     def __init__(self,
                  asset_parent_d,
@@ -116,16 +132,54 @@ class Asset(object):
         self.data_d = os.path.join(self.asset_d, ".data")
         self.thumbnail_data_d = os.path.join(self.asset_d, ".thumbnaildata")
         self.metadata_d = os.path.join(self.asset_d, ".metadata")
+        self.semaphore_p = os.path.join(self.asset_d, ".asset")
+        self.notes_p = os.path.join(self.metadata_d, "notes")
+        self.log_p = os.path.join(self.metadata_d, "log")
 
         self.config_obj = config_obj
 
         self.keywords_obj = Keywords(self.localized_resource_obj, self.asset_d)
         self.key_values_obj = KeyValuePairs(self.localized_resource_obj, self.asset_d)
 
-        self.version_objs = self._get_all_versions()
-        self.pin_objs = self._get_all_pins()
+        # Versions and pins are only scanned from disk the first time they are needed (metadata-only operations like
+        # keywords, key/value pairs, and notes never touch them).
+        self._version_objs = None
+        self._pin_objs = None
+        self._asset_d_scan = None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def version_objs(self) -> dict:
+        """
+        A dictionary of all the versions in the asset where the key is the version integer and the value is a version
+        object. Built from disk on first access.
 
-        self.data_sizes = dict()
+        :return:
+                A dictionary where the key=version integer, and the value=version object.
+        """
+
+        if self._version_objs is None:
+            self._version_objs = self._get_all_versions()
+            if self._pin_objs is not None:
+                self._asset_d_scan = None
+        return self._version_objs
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def pin_objs(self) -> dict:
+        """
+        A dictionary of all the pins in the asset where the key is the pin name and the value is a pin object. Built
+        from disk on first access.
+
+        :return:
+                A dictionary where the key=pin name, and the value=pin object.
+        """
+
+        if self._pin_objs is None:
+            self._pin_objs = self._get_all_pins()
+            if self._version_objs is not None:
+                self._asset_d_scan = None
+        return self._pin_objs
 
     # ------------------------------------------------------------------------------------------------------------------
     def is_asset(self) -> bool:
@@ -136,33 +190,69 @@ class Asset(object):
             True if the Asset refers to an actual asset on disk (has a .asset semaphore file). False otherwise.
         """
 
-        return os.path.exists(os.path.join(self.asset_d, ".asset"))
+        return os.path.exists(self.semaphore_p)
 
     # ------------------------------------------------------------------------------------------------------------------
-    def _get_all_version_strings(self) -> list:
+    def _scan_asset_d(self) -> tuple:
         """
-        Returns a list of all the version strings that exist on disk.
+        Reads the asset directory once and sorts the entries into version directories and symlinks (potential pins).
+        The result is held until both the versions and the pins have been loaded from it so that loading both only
+        reads the directory a single time. Anything that adds or removes a version or a pin link drops the held result
+        (see _drop_asset_d_scan).
 
         :return:
-                A list of strings that represent all of the version numbers.
+                A tuple containing a list of version strings and a list of the paths of all the symlinks.
         """
 
-        output = list()
+        if self._asset_d_scan is not None:
+            return self._asset_d_scan
 
-        if not os.path.exists(self.asset_d):
-            return []
+        version_strs = list()
+        links_p = list()
 
-        items = os.listdir(self.asset_d)
-        for item in items:
-            if os.path.isdir(os.path.join(self.asset_d, item)):
-                result = re.match(pattern=VERSION_PATTERN, string=str(item))
-                if result is not None:
-                    output.append(item)
+        try:
+            entries = os.scandir(self.asset_d)
+        except FileNotFoundError:
+            return version_strs, links_p
+
+        with entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    links_p.append(entry.path)
+                if entry.is_dir():
+                    result = VERSION_RE.match(entry.name)
+                    if result is not None:
+                        version_strs.append(entry.name)
+
+        self._asset_d_scan = (version_strs, links_p)
+        return self._asset_d_scan
 
-        return output
+    # ------------------------------------------------------------------------------------------------------------------
+    def _drop_asset_d_scan(self):
+        """
+        Forgets the held scan of the asset directory after a version or a pin link was added or removed on disk, so
+        that versions or pins that have not been loaded yet are read fresh.
+
+        :return:
+                Nothing.
+        """
+
+        self._asset_d_scan = None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _get_all_version_strings(self) -> list:
+        """
+        Returns a list of all the version strings that exist on disk.
+
+        :return:
+                A list of strings that represent all of the version numbers.
+        """
+
+        return self._scan_asset_d()[0]
 
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _version_int_from_str(version_str) -> int:
         """
         Given a version as a string, return an integer. Does not check whether this value equates to an actual version
@@ -174,7 +264,7 @@ class Asset(object):
 
         assert type(version_str) is str
 
-        result = re.match(pattern=VERSION_PATTERN, string=version_str)
+        result = VERSION_RE.match(version_str)
 
         return int(result.groups()[1])
 
@@ -326,18 +416,23 @@ class Asset(object):
 
         output = dict()
 
-        if not os.path.exists(self.asset_d):
-            return output
-
-        items = os.listdir(self.asset_d)
-        for potential_pin in items:
-            potential_pin_p = os.path.join(self.asset_d, potential_pin)
-            if os.path.islink(potential_pin_p):
-                potential_version_str = os.path.split(str(Path(potential_pin_p).resolve()))[1]
-                result = re.match(pattern=VERSION_PATTERN, string=potential_version_str)
-                if result:
-                    output[potential_pin.upper()] = self._new_pin_obj(pin_n=potential_pin,
-                                                                      pin_must_exist=True)
+        version_strs, links_p = self._scan_asset_d()
+        version_strs = set(version_strs)
+
+        # Pins are direct links to a version directory in the asset, so reading the link (one syscall) is enough to
+        # find the version. There is no need to resolve every component of the path. Only links to versions that are
+        # actually in the asset dir count as pins (so a dangling link is skipped rather than failing to load).
+        for potential_pin_p in links_p:
+            try:
+                potential_version_str = os.path.basename(os.readlink(potential_pin_p).rstrip(os.sep))
+            except FileNotFoundError:
+                continue  # The link was removed since the asset dir was scanned.
+            if potential_version_str in version_strs:
+                potential_pin = os.path.basename(potential_pin_p)
+                if Pin.pin_name_error_code(potential_pin.upper()) is not None:
+                    continue  # Not a pin (e.g. a link that is part way through being updated by Pin.create_link).
+                output[potential_pin.upper()] = self._new_pin_obj(pin_n=potential_pin,
+                                                                  pin_must_exist=True)
 
         return output
 
@@ -354,6 +449,18 @@ class Asset(object):
                 A version object that encapsulates this version.
         """
 
+        # If the pins have not been loaded yet, read just this one link instead of scanning the whole asset directory.
+        # Like _get_all_pins, only a link to a version counts as a pin. Anything else (a missing link, a link to some
+        # other directory, or a pin whose link on disk is not upper case) falls back to the full scan below.
+        if self._pin_objs is None:
+            try:
+                version_str = os.path.basename(os.readlink(os.path.join(self.asset_d, pin_n)).rstrip(os.sep))
+            except OSError:
+                version_str = None
+            if version_str is not None and VERSION_RE.match(version_str) is not None:
+                return self._new_pin_obj(pin_n=pin_n,
+                                         pin_must_exist=True)
+
         try:
             return self.pin_objs[pin_n]
         except KeyError:
@@ -384,6 +491,22 @@ class Asset(object):
 
         return output
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def _pins_by_version_str(self) -> dict:
+        """
+        Builds a reverse map of all the pins in the asset, keyed on the version they reference.
+
+        :return:
+                A dictionary where the key=version string, and the value=a list of the pins that reference that version.
+        """
+
+        output = dict()
+
+        for pin_n, pin_target in self.pin_objs.items():
+            output.setdefault(pin_target.version_str, []).append(pin_n)
+
+        return output
+
     # ------------------------------------------------------------------------------------------------------------------
     def _create_asset_directory(self):
         """
@@ -394,15 +517,12 @@ class Asset(object):
         """
 
         try:
-            os.mkdir(self.asset_d)
-        except OSError as e:
-            if e.errno == errno.EEXIST and os.path.isdir(self.asset_d):
-                # Someone else has already created this asset directory. That is ok.
-                pass
-            else:
-                err_msg = self.localized_resource_obj.get_error_msg(30000)
-                err_msg = err_msg.format(asset_d=self.asset_d)
-                raise SquirrelError(err_msg, 30000)
+            # Someone else may have already created this asset directory. That is ok.
+            os.makedirs(self.asset_d, exist_ok=True)
+        except OSError:
+            err_msg = self.localized_resource_obj.get_error_msg(30000)
+            err_msg = err_msg.format(asset_d=self.asset_d)
+            raise SquirrelError(err_msg, 30000)
 
     # ------------------------------------------------------------------------------------------------------------------
     def _create_asset_semaphore(self):
@@ -413,12 +533,11 @@ class Asset(object):
                Nothing.
         """
 
-        if os.path.exists(os.path.join(self.asset_d, ".asset")):
-            return
-
         try:
-            with open(os.path.join(self.asset_d, ".asset"), 'w') as f:
+            with open(self.semaphore_p, 'x') as f:
                 f.write(BVZASSET_STRUCTURE_VERSION + "\n")
+        except FileExistsError:
+            return
         except OSError:
             err_msg = self.localized_resource_obj.get_error_msg(30001)
             err_msg = err_msg.format(asset_d=self.asset_d)
@@ -435,13 +554,7 @@ class Asset(object):
                 Nothing.
         """
 
-        try:
-            os.mkdir(self.data_d)
-        except OSError as e:
-            if e.errno == errno.EEXIST and os.path.isdir(self.data_d):
-                pass
-            else:
-                raise
+        os.makedirs(self.data_d, exist_ok=True)
 
     # ------------------------------------------------------------------------------------------------------------------
     def _create_thumbnail_data_dir(self):
@@ -452,13 +565,7 @@ class Asset(object):
                 Nothing.
         """
 
-        try:
-            os.mkdir(self.thumbnail_data_d)
-        except OSError as e:
-            if e.errno == errno.EEXIST and os.path.isdir(self.thumbnail_data_d):
-                pass
-            else:
-                raise
+        os.makedirs(self.thumbnail_data_d, exist_ok=True)
 
     # ------------------------------------------------------------------------------------------------------------------
     def _create_metadata_dir(self):
@@ -469,13 +576,7 @@ class Asset(object):
                 Nothing.
         """
 
-        try:
-            os.mkdir(self.metadata_d)
-        except OSError as e:
-            if e.errno == errno.EEXIST and os.path.isdir(self.metadata_d):
-                pass
-            else:
-                raise
+        os.makedirs(self.metadata_d, exist_ok=True)
 
     # ------------------------------------------------------------------------------------------------------------------
     def _create_asset_structure(self):
@@ -521,22 +622,49 @@ class Asset(object):
         new_version_obj = self._new_version_obj(version_int=new_version_num,
                                                 version_must_exist=False)
 
-        shutil.copytree(src=current_version_obj.version_d,
-                        dst=new_version_obj.version_d,
-                        symlinks=True,
-                        ignore_dangling_symlinks=True)
+        # The version and metadata trees are independent and copying them is almost entirely symlink syscalls (which
+        # release the GIL) so copy them side by side.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            version_future = executor.submit(shutil.copytree,
+                                             src=current_version_obj.version_d,
+                                             dst=new_version_obj.version_d,
+                                             symlinks=True,
+                                             ignore_dangling_symlinks=True)
+
+            # Version level notes are not copied so that the new version starts with a clean slate. Only the notes file
+            # at the top of the version metadata dir is skipped, anything named "notes" further down is still copied.
+            metadata_future = executor.submit(shutil.copytree,
+                                              src=current_version_obj.version_metadata_d,
+                                              dst=new_version_obj.version_metadata_d,
+                                              symlinks=True,
+                                              ignore=self._ignore_version_notes(current_version_obj),
+                                              ignore_dangling_symlinks=True)
+
+        version_future.result()
+        metadata_future.result()
 
-        shutil.copytree(src=current_version_obj.version_metadata_d,
-                        dst=new_version_obj.version_metadata_d,
-                        symlinks=True,
-                        ignore_dangling_symlinks=True)
+        return new_version_obj
 
-        # Version level notes should be removed so that it is a clean slate
-        notes_p = os.path.join(new_version_obj.version_metadata_d, "notes")
-        if os.path.exists(notes_p):
-            os.remove(notes_p)
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _ignore_version_notes(version_obj):
+        """
+        Returns an ignore function for shutil.copytree that skips the notes file at the top level of the given
+        version's metadata dir (and nothing else).
 
-        return new_version_obj
+        :param version_obj:
+                The version object whose metadata dir is being copied.
+
+        :return:
+                A function suitable for the ignore argument of shutil.copytree.
+        """
+
+        def ignore(src_d, _):
+            if src_d == version_obj.version_metadata_d:
+                return {"notes"}
+            return set()
+
+        return ignore
 
     # ------------------------------------------------------------------------------------------------------------------
     def _create_version(self,
@@ -565,6 +693,8 @@ class Asset(object):
                                                 version_must_exist=False)
             version_obj.create_dirs()
 
+        self._drop_asset_d_scan()
+
         return version_obj
 
     # ------------------------------------------------------------------------------------------------------------------
@@ -651,6 +781,44 @@ class Asset(object):
         latest_version_int = self._get_highest_ver_num()
         return self.version_objs[latest_version_int].version_str
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def _files_referenced_by_other_versions(self,
+                                            version_int,
+                                            files_func) -> set:
+        """
+        Builds a set of all the data files referenced by every version except the one given by version_int. These are
+        the files that must be kept when that version (or its thumbnails) are deleted.
+
+        :param version_int:
+                The integer that identifies the version to exclude.
+        :param files_func:
+                The Version method that lists the data files of a single version (i.e. Version.user_data_files or
+                Version.thumbnail_data_files).
+
+        :return:
+                A set of the full paths to the referenced data files.
+        """
+
+        assert type(version_int) is int
+        assert callable(files_func)
+
+        version_objs = [version_obj for version_obj in self.version_objs.values()
+                        if version_obj.version_int != version_int]
+
+        # Listing a version is a tree walk that is almost entirely readdir/readlink latency, so when there are several
+        # versions to list, walk them side by side.
+        if len(version_objs) > 2:
+            with ThreadPoolExecutor(max_workers=min(8, len(version_objs))) as executor:
+                files_per_version = list(executor.map(files_func, version_objs))
+        else:
+            files_per_version = [files_func(version_obj) for version_obj in version_objs]
+
+        output = set()
+        for files in files_per_version:
+            output.update(files)
+
+        return output
+
     # ------------------------------------------------------------------------------------------------------------------
     def delete_version(self,
                        version_int,
@@ -680,14 +848,13 @@ class Asset(object):
             err_msg = err_msg.format(version=version_int, pin=", ".join(pins))
             raise SquirrelError(err_msg, 13001)
 
-        # Build a list of the files that these versions reference (we will be keeping these files)
-        files_to_keep = list()
-        for version_obj in self.version_objs.values():
-            if version_obj.version_int != version_int:
-                files_to_keep.extend(version_obj.user_data_files())
+        # Build a set of the files that the other versions reference (we will be keeping these files)
+        files_to_keep = self._files_referenced_by_other_versions(version_int=version_int,
+                                                                 files_func=Version.user_data_files)
 
         # Now delete this version
         version_to_delete_obj.delete_version(files_to_keep=files_to_keep)
+        self._drop_asset_d_scan()
 
         # Update the list of versions
         del(self.version_objs[version_int])
@@ -717,13 +884,38 @@ class Asset(object):
         # Build a list of versions to delete (all but the highest numbered version)
         latest_version_int = self._get_highest_ver_num()
 
-        version_ints_to_delete = list()
-        for version_int in self.version_objs.keys():
-            if version_int != latest_version_int:
-                version_ints_to_delete.append(version_int)
+        version_ints_to_delete = self.version_objs.keys() - {latest_version_int}
+        version_objs_to_delete = [self.version_objs[version_int] for version_int in sorted(version_ints_to_delete)]
+
+        # Cannot delete a version if any pins reference it. Check them all before anything is deleted.
+        pins_by_version_str = self._pins_by_version_str()
+        for version_obj in version_objs_to_delete:
+            pins = pins_by_version_str.get(version_obj.version_str)
+            if pins:
+                err_msg = self.localized_resource_obj.get_error_msg(13001)
+                err_msg = err_msg.format(version=version_obj.version_int, pin=", ".join(pins))
+                raise SquirrelError(err_msg, 13001)
+
+        # Delete all of the versions in one pass: only the files referenced by the surviving version are kept, so each
+        # version's files are listed once (instead of re-listing every other version for each deleted version).
+        if version_objs_to_delete:
+            files_to_keep = set(self._version_object(latest_version_int).user_data_files())
+
+            files_to_delete = set()
+            for version_obj in version_objs_to_delete:
+                files_to_delete.update(version_obj.user_data_files())
 
-        for version_int in version_ints_to_delete:
-            self.delete_version(version_int=version_int)
+            for file_to_delete in files_to_delete - files_to_keep:
+                try:
+                    os.remove(file_to_delete)
+                except FileNotFoundError:
+                    pass
+
+            for version_obj in version_objs_to_delete:
+                version_obj.delete_dirs()
+                del(self.version_objs[version_obj.version_int])
+
+            self._drop_asset_d_scan()
 
         if log_str is not None:
             version_obj = self._version_object(latest_version_int)
@@ -777,7 +969,9 @@ class Asset(object):
             err_msg = err_msg.format(version=version_int)
             raise SquirrelError(err_msg, 11000)
 
-        self.pin_objs[pin_n] = pin_obj
+        self._drop_asset_d_scan()
+
+        self.pin_objs[pin_obj.pin_n] = pin_obj
 
         if log_str is not None:
             log_msg = self.localized_resource_obj.get_msg("log_str_set_pin")
@@ -812,6 +1006,9 @@ class Asset(object):
 
         pin_obj = self._pin_obj(pin_n)
         pin_obj.delete_link(allow_delete_locked)
+        self._drop_asset_d_scan()
+        if self._pin_objs is not None:
+            self._pin_objs.pop(pin_n, None)
 
         if log_str is not None:
             log_msg = self.localized_resource_obj.get_msg("log_str_deleted_pin")
@@ -955,11 +1152,9 @@ class Asset(object):
         assert type(version_int) is int
         assert log_str is None or type(log_str) is str
 
-        # Build a list of thumbnails that these versions reference (we will be keeping these.)
-        files_to_keep = list()
-        for version_obj in self.version_objs.values():
-            if version_obj.version_int != version_int:
-                files_to_keep.extend(version_obj.thumbnail_data_files())
+        # Build a set of thumbnails that the other versions reference (we will be keeping these.)
+        files_to_keep = self._files_referenced_by_other_versions(version_int=version_int,
+                                                                 files_func=Version.thumbnail_data_files)
 
         # Now delete the thumbnails from this version
         version_obj = self._version_object(version_int)
@@ -1066,7 +1261,7 @@ class Asset(object):
 
         if log_str is not None:
             log_msg = self.localized_resource_obj.get_msg("log_str_delete_keywords")
-            log_str += log_msg.format(keywords=", ".join(keywords))
+            log_str += log_msg.format(keywords=", ".join([keyword.upper() for keyword in keywords]))
             self.append_to_log(log_str)
 
     # ------------------------------------------------------------------------------------------------------------------
@@ -1269,8 +1464,7 @@ class Asset(object):
         assert type(overwrite) is bool
         assert log_str is None or type(log_str) is str
 
-        notes_p = os.path.join(self.metadata_d, "notes")
-        libtext.write_to_text_file(notes_p, notes, overwrite)
+        libtext.write_to_text_file(self.notes_p, notes, overwrite)
 
         if log_str is not None:
             log_msg = self.localized_resource_obj.get_msg("log_str_added_notes")
@@ -1292,9 +1486,10 @@ class Asset(object):
 
         assert log_str is None or type(log_str) is str
 
-        notes_p = os.path.join(self.metadata_d, "notes")
-        if os.path.exists(notes_p):
-            os.remove(notes_p)
+        try:
+            os.remove(self.notes_p)
+        except FileNotFoundError:
+            pass
 
         if log_str is not None:
             log_msg = self.localized_resource_obj.get_msg("log_str_delete_all_asset_notes")
@@ -1311,12 +1506,9 @@ class Asset(object):
         """
 
         output = ""
-        notes_p = os.path.join(self.metadata_d, "notes")
-        if os.path.exists(notes_p):
-            with open(notes_p, "r") as f:
-                lines = f.readlines()
-            output = [line.rstrip() for line in lines]
-            output = "\n".join(output)
+        if os.path.exists(self.notes_p):
+            with open(self.notes_p, "r") as f:
+                output = "\n".join([line.rstrip() for line in f.read().splitlines()])
 
         return output
 
@@ -1335,8 +1527,7 @@ class Asset(object):
 
         assert type(text) is str
 
-        log_p = os.path.join(self.asset_d, ".metadata", "log")
-        libtext.write_to_text_file(file_p=log_p,
+        libtext.write_to_text_file(file_p=self.log_p,
                                    text=text,
                                    overwrite=False)
 
@@ -1351,11 +1542,8 @@ class Asset(object):
 
         output = ""
 
-        log_p = os.path.join(self.asset_d, ".metadata", "log")
-        if os.path.exists(log_p):
-            with open(log_p, "r") as f:
-                lines = f.readlines()
-            output = [line.rstrip() for line in lines]
-            output = "\n".join(output)
+        if os.path.exists(self.log_p):
+            with open(self.log_p, "r") as f:
+                output = "\n".join([line.rstrip() for line in f.read().splitlines()])
 
         return output
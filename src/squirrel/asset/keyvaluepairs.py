@@ -25,6 +25,9 @@ class KeyValuePairs(object):
         self.asset_d = asset_d
         self.keyvalues_p = os.path.join(asset_d, ".metadata", "keyvalues")
 
+        # The contents of the keyvalues file as last read or written by this object. None until the file is read.
+        self._key_value_pairs = None
+
     # ------------------------------------------------------------------------------------------------------------------
     def _verify_asset_dir_exists(self):
         """
@@ -38,19 +41,6 @@ class KeyValuePairs(object):
             err_msg = self.localized_resource_obj.get_error_msg(11208)
             raise SquirrelError(err_msg, 11208)
 
-    # ------------------------------------------------------------------------------------------------------------------
-    def _verify_key_value_file_exists(self):
-        """
-        Checks to make sure the key value file exists.
-
-        :return:
-                Nothing.
-        """
-
-        if not os.path.exists(self.keyvalues_p):
-            err_msg = self.localized_resource_obj.get_error_msg(11109)
-            raise SquirrelError(err_msg, 11109)
-
     # ------------------------------------------------------------------------------------------------------------------
     def add_key_value_pairs(self,
                             key_value_pairs):
@@ -66,19 +56,23 @@ class KeyValuePairs(object):
 
         assert type(key_value_pairs) is dict
 
-        self._verify_asset_dir_exists()
-
         try:
             existing_keys = self.get_key_value_pairs()
         except SquirrelError:
+            self._verify_asset_dir_exists()
             existing_keys = dict()
+        else:
+            # Nothing to merge into a keyvalues file that already exists.
+            if not key_value_pairs:
+                return
 
         for key, value in key_value_pairs.items():
             existing_keys[key.upper()] = value
 
         with open(self.keyvalues_p, "w") as f:
-            for key, value in existing_keys.items():
-                f.write(key + "=" + value + "\n")
+            f.write("".join(key + "=" + value + "\n" for key, value in existing_keys.items()))
+
+        self._key_value_pairs = {key: value.rstrip() for key, value in existing_keys.items()}
 
     # ------------------------------------------------------------------------------------------------------------------
     def remove_key_value_pairs(self,
@@ -93,36 +87,52 @@ class KeyValuePairs(object):
                 Nothing.
         """
 
-        self._verify_asset_dir_exists()
-
         assert type(keys) is list
 
         for i in range(len(keys)):
             keys[i] = keys[i].upper()
 
-        existing_key_value_pairs = self.get_key_value_pairs()
+        try:
+            existing_key_value_pairs = self.get_key_value_pairs()
+        except SquirrelError:
+            self._verify_asset_dir_exists()
+            raise
+
+        written_key_value_pairs = dict()
+        for existing_key, value in existing_key_value_pairs.items():
+            if existing_key.strip().upper() not in keys:
+                written_key_value_pairs[existing_key.strip().upper()] = value.rstrip()
+
+        # None of the keys were in the file, so there is nothing to rewrite.
+        if len(written_key_value_pairs) == len(existing_key_value_pairs):
+            return
 
         with open(self.keyvalues_p, "w") as f:
-            for existing_key, value in existing_key_value_pairs.items():
-                if existing_key.strip().upper() not in keys:
-                    f.write(existing_key.strip().upper() + "=" + value + "\n")
+            f.write("".join(key + "=" + value + "\n" for key, value in written_key_value_pairs.items()))
+
+        self._key_value_pairs = written_key_value_pairs
 
     # ------------------------------------------------------------------------------------------------------------------
     def get_key_value_pairs(self):
         """
-        Returns a dictionary of key value pairs from the keyvalues metadata file.
+        Returns a dictionary of key value pairs from the keyvalues metadata file. The file is only read the first time,
+        after that the key value pairs as last read or written by this object are returned.
 
         :return:
                 A dictionary of key value pairs.
         """
 
-        self._verify_key_value_file_exists()
-
-        with open(self.keyvalues_p, "r") as f:
-            lines = f.readlines()
+        if self._key_value_pairs is None:
+            try:
+                with open(self.keyvalues_p, "r") as f:
+                    lines = f.read().splitlines()
+            except FileNotFoundError:
+                err_msg = self.localized_resource_obj.get_error_msg(11109)
+                raise SquirrelError(err_msg, 11109)
 
-        output = dict()
-        for line in lines:
-            output[line.split("=", 1)[0]] = line.split("=", 1)[1].rstrip()
+            self._key_value_pairs = dict()
+            for line in lines:
+                key, value = line.split("=", 1)
+                self._key_value_pairs[key] = value.rstrip()
 
-        return output
+        return dict(self._key_value_pairs)
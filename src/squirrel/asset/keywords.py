@@ -25,6 +25,9 @@ class Keywords(object):
         self.asset_d = asset_d
         self.keywords_p = os.path.join(asset_d, ".metadata", "keywords")
 
+        # The contents of the keywords file as last read or written by this object. None until the file is read.
+        self._keywords = None
+
     # ------------------------------------------------------------------------------------------------------------------
     def _verify_asset_dir_exists(self):
         """
@@ -51,19 +54,6 @@ class Keywords(object):
             err_msg = self.localized_resource_obj.get_error_msg(10010)
             raise SquirrelError(err_msg, 10010)
 
-    # ------------------------------------------------------------------------------------------------------------------
-    def _verify_keywords_file_exists(self):
-        """
-        Checks to make sure the keywords file exists.
-
-        :return:
-                Nothing.
-        """
-
-        if not os.path.exists(self.keywords_p):
-            err_msg = self.localized_resource_obj.get_error_msg(11108)
-            raise SquirrelError(err_msg, 11108)
-
     # ------------------------------------------------------------------------------------------------------------------
     def add_keywords(self,
                      keywords):
@@ -81,24 +71,33 @@ class Keywords(object):
         for keyword in keywords:
             assert type(keyword) is str
 
-        self._verify_asset_dir_exists()
-        self._verify_metadata_dir_exists()
-
+        # An existing (or already read) keywords file means both directories exist, so they only need checking when
+        # there is no file yet.
         try:
             existing_keywords = self.list_keywords()
         except SquirrelError:
-            existing_keywords = list()
+            self._verify_asset_dir_exists()
+            self._verify_metadata_dir_exists()
+            existing_keywords = None
 
-        keywords.sort()
-        if not os.path.exists(self.keywords_p):
-            write_style = "w"
+        if existing_keywords is None:
+            existing_keywords_upper = set()
         else:
-            write_style = "a"
+            existing_keywords_upper = {kw.upper() for kw in existing_keywords}
+
+        # dict.fromkeys drops repeated keywords in the input while keeping their order.
+        new_keywords = [keyword for keyword in dict.fromkeys(keyword.upper() for keyword in sorted(keywords))
+                        if keyword not in existing_keywords_upper]
 
-        with open(self.keywords_p, write_style) as f:
-            for keyword in keywords:
-                if not keyword.upper() in [kw.upper() for kw in existing_keywords]:
-                    f.write(keyword.upper() + "\n")
+        # Nothing to append to a keywords file that already exists.
+        if not new_keywords and existing_keywords is not None:
+            return
+
+        # Appending creates the file if it does not exist yet.
+        with open(self.keywords_p, "a") as f:
+            f.write("".join(keyword + "\n" for keyword in new_keywords))
+
+        self._keywords = (existing_keywords or list()) + new_keywords
 
     # ------------------------------------------------------------------------------------------------------------------
     def remove_keywords(self,
@@ -113,34 +112,46 @@ class Keywords(object):
                 Nothing.
         """
 
-        self._verify_asset_dir_exists()
-
         assert type(keywords) is list
         for keyword in keywords:
             assert type(keyword) is str
 
-        for i in range(len(keywords)):
-            keywords[i] = keywords[i].upper()
+        keywords = {keyword.upper() for keyword in keywords}
+
+        try:
+            existing_keywords = self.list_keywords()
+        except SquirrelError:
+            self._verify_asset_dir_exists()
+            raise
+
+        written_keywords = [existing_keyword.strip().upper() for existing_keyword in existing_keywords
+                            if existing_keyword.strip().upper() not in keywords]
 
-        existing_keywords = self.list_keywords()
+        # None of the keywords were in the file, so there is nothing to rewrite.
+        if len(written_keywords) == len(existing_keywords):
+            return
 
         with open(self.keywords_p, "w") as f:
-            for existing_keyword in existing_keywords:
-                if existing_keyword.strip().upper() not in keywords:
-                    f.write(existing_keyword.strip().upper() + "\n")
+            f.write("".join(keyword + "\n" for keyword in written_keywords))
+
+        self._keywords = written_keywords
 
     # ------------------------------------------------------------------------------------------------------------------
     def list_keywords(self):
         """
-        Lists keywords from the "keywords" metadata file.
+        Lists keywords from the "keywords" metadata file. The file is only read the first time, after that the
+        keywords as last read or written by this object are returned.
 
         :return:
                 A list of keywords.
         """
 
-        self._verify_keywords_file_exists()
-
-        with open(self.keywords_p, "r") as f:
-            lines = f.readlines()
+        if self._keywords is None:
+            try:
+                with open(self.keywords_p, "r") as f:
+                    self._keywords = [line.rstrip() for line in f.read().splitlines()]
+            except FileNotFoundError:
+                err_msg = self.localized_resource_obj.get_error_msg(11108)
+                raise SquirrelError(err_msg, 11108)
 
-        return [x.rstrip() for x in lines]
+        return list(self._keywords)
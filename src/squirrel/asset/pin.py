@@ -1,6 +1,6 @@
+import functools
 import os
-from pathlib import Path
-import re
+import stat
 
 from bvzlocalization import LocalizedResource
 from squirrel.asset.version import Version
@@ -14,6 +14,17 @@ class Pin(object):
     Class responsible for managing a single pin. Pins are symlinks to specific versions.
     """
 
+    __slots__ = ("localized_resource_obj",
+                 "asset_d",
+                 "pin_n",
+                 "link_n",
+                 "attr_pin_n",
+                 "pin_p",
+                 "attr_pin_p",
+                 "locked_semaphore_p",
+                 "version_str",
+                 "version_int")
+
     # ------------------------------------------------------------------------------------------------------------------
     def __init__(self,
                  pin_n,
@@ -24,7 +35,7 @@ class Pin(object):
         An object responsible for managing a single pin.
 
         :param pin_n:
-                The name of the pin.
+                The name of the pin. For an existing pin this is the name of its link on disk.
         :param asset_d:
                 The path to the asset root.
         :param must_exist:
@@ -41,14 +52,25 @@ class Pin(object):
         self.localized_resource_obj = localized_resource_obj
 
         self.asset_d = asset_d
-        self._validate_asset_d()
+
+        # An existing pin implies an existing asset dir, so only check it separately when the pin is not required.
+        if not must_exist:
+            self._validate_asset_d()
 
         self.pin_n = pin_n.upper()
         self._validate_pin_name(self.pin_n)
 
-        self.pin_p = os.path.join(asset_d, pin_n)
-        self.attr_pin_p = os.path.join(asset_d, "." + pin_n)
-        self.locked_semaphore_p = os.path.join(asset_d, f".{pin_n.upper()}_locked")
+        # New links are always created with the upper-cased name. An existing pin is addressed by the name its link
+        # actually has on disk (which may not be upper case if it was made by hand).
+        if must_exist:
+            self.link_n = pin_n
+        else:
+            self.link_n = self.pin_n
+
+        self.attr_pin_n = "." + self.link_n
+        self.pin_p = os.path.join(asset_d, self.link_n)
+        self.attr_pin_p = os.path.join(asset_d, self.attr_pin_n)
+        self.locked_semaphore_p = os.path.join(asset_d, f".{self.pin_n}_locked")
 
         if must_exist:
             self._validate_pin_exists()
@@ -72,6 +94,7 @@ class Pin(object):
 
     # ------------------------------------------------------------------------------------------------------------------
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _version_int_from_str(version_str) -> int:
         """
         Given a version as a string, return an integer. Does not check whether this value equates to an actual version
@@ -83,7 +106,7 @@ class Pin(object):
 
         assert type(version_str) is str
 
-        result = re.match(pattern=VERSION_PATTERN, string=version_str)
+        result = VERSION_RE.match(version_str)
 
         return int(result.groups()[1])
 
@@ -97,6 +120,7 @@ class Pin(object):
         """
 
         if not self.exists():
+            self._validate_asset_d()  # Report a missing asset dir (vs. a missing pin) if that is the real cause
             err_msg = self.localized_resource_obj.get_error_msg(11002)
             err_msg = err_msg.format(pin=self.pin_n)
             raise SquirrelError(err_msg, 11002)
@@ -113,45 +137,65 @@ class Pin(object):
             raise SquirrelError(err_msg, 11208)
 
     # ------------------------------------------------------------------------------------------------------------------
-    def _validate_pin_name(self,
-                           pin_n):
+    @staticmethod
+    def pin_name_error_code(pin_n):
         """
         Pin names may not be one of the following reserved names: thumbnaildata, data.
         Pin names may not begin with a ".". Pin names may not end with "_locked".
 
         :param pin_n:
-                Then name of the pin.
+                Then name of the pin, already upper-cased.
 
         :return:
-                Nothing.
+                The error code describing why the name is not a valid pin name. None if it is a valid pin name.
         """
 
         assert type(pin_n) is str
 
         if pin_n[0] == ".":
-            err_msg = self.localized_resource_obj.error(11112)
-            err_msg = err_msg.format(pin=pin_n)
-            raise SquirrelError(err_msg, 11112)
+            return 11112
 
-        if pin_n.upper() in ["THUMBNAILDATA", "DATA"]:
-            err_msg = self.localized_resource_obj.get_error_msg(11103)
-            err_msg = err_msg.format(pin=pin_n)
-            raise SquirrelError(err_msg, 11103)
+        if pin_n in RESERVED_PIN_NAMES:
+            return 11103
+
+        if pin_n.endswith("_LOCKED"):
+            return 11111
+
+        return None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _validate_pin_name(self,
+                           pin_n):
+        """
+        Raises an error if pin_n is not a valid pin name (see pin_name_error_code).
+
+        :param pin_n:
+                Then name of the pin, already upper-cased.
 
-        if pin_n.upper().endswith("_LOCKED"):
-            err_msg = self.localized_resource_obj.get_error_msg(11111)
-            raise SquirrelError(err_msg, 11111)
+        :return:
+                Nothing.
+        """
+
+        err_code = self.pin_name_error_code(pin_n)
+
+        if err_code is not None:
+            err_msg = self.localized_resource_obj.get_error_msg(err_code)
+            err_msg = err_msg.format(pin=pin_n)
+            raise SquirrelError(err_msg, err_code)
 
     # ------------------------------------------------------------------------------------------------------------------
     def _get_version_str(self):
         """
         If the pin exists, gets the name of the version the pin references. The pin must exist on disk.
 
+        Pins are always created as links directly to a version directory (i.e. ./v0001) so the link target is read as
+        is rather than resolving every component of the path.
+
         :return:
                 A string representing the name of the version the pin references.
         """
 
-        return os.path.split(str(Path(self.pin_p).resolve()))[1]
+        return os.path.basename(os.readlink(self.pin_p).rstrip(os.sep))
 
     # ------------------------------------------------------------------------------------------------------------------
     def is_locked(self):
@@ -185,8 +229,10 @@ class Pin(object):
                 Nothing.
         """
 
-        if self.is_locked():
+        try:
             os.remove(self.locked_semaphore_p)
+        except FileNotFoundError:
+            pass
 
     # ------------------------------------------------------------------------------------------------------------------
     def create_link(self,
@@ -213,23 +259,62 @@ class Pin(object):
         assert type(allow_delete_locked) is bool
         assert type(lock) is bool
 
-        self.delete_link(allow_delete_locked=allow_delete_locked)
+        self._validate_can_delete(allow_delete_locked=allow_delete_locked)
+
+        # Any previous links are swapped out for the new ones rather than deleted first, so there is never a moment
+        # where the pin is missing.
+        self._is_link(self.pin_p, 11008)
+        self._is_link(self.attr_pin_p, 11102)
+
+        self.unlock()
 
-        src = "./" + version_obj.version_str
-        dst = os.path.join(".", self.asset_d, self.pin_n)
-        if os.path.islink(dst):
-            os.unlink(dst)
-        os.symlink(src, dst)
+        # Both links (and their temporary names) live directly in the asset dir, so open it once and create them
+        # relative to it instead of having every call resolve the full asset path again.
+        asset_d_fd = os.open(self.asset_d, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            self._replace_link("./" + version_obj.version_str, self.link_n, asset_d_fd)
+            self._replace_link("./" + version_obj.metadata_str, self.attr_pin_n, asset_d_fd)
+        finally:
+            os.close(asset_d_fd)
 
-        src = "./." + version_obj.version_str
-        dst = os.path.join(".", self.asset_d, "." + self.pin_n)
-        if os.path.islink(dst):
-            os.unlink(dst)
-        os.symlink(src, dst)
+        self.version_str = version_obj.version_str
+        self.version_int = version_obj.version_int
 
         if lock:
             self.lock()
 
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _replace_link(src,
+                      link_n,
+                      dir_fd):
+        """
+        Atomically creates (or replaces) a symlink named link_n pointing to src. The link is created under a temporary
+        name next to link_n and then renamed over it.
+
+        :param src:
+                The target of the link.
+        :param link_n:
+                The name of the link to create, relative to dir_fd.
+        :param dir_fd:
+                An open file descriptor of the directory that holds the link.
+
+        :return:
+                Nothing.
+        """
+
+        # The temporary name starts with a "." so that it is never a valid pin name, and scanning the asset while the
+        # link is being swapped in will not mistake it for a pin.
+        tmp_n = f".{link_n}.{os.getpid()}.tmp"
+
+        try:
+            os.symlink(src, tmp_n, dir_fd=dir_fd)
+        except FileExistsError:
+            os.unlink(tmp_n, dir_fd=dir_fd)  # Left over from an interrupted update by a process with the same pid.
+            os.symlink(src, tmp_n, dir_fd=dir_fd)
+
+        os.replace(tmp_n, link_n, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+
     # ------------------------------------------------------------------------------------------------------------------
     def delete_link(self,
                     allow_delete_locked):
@@ -246,23 +331,58 @@ class Pin(object):
 
         assert type(allow_delete_locked) is bool
 
+        self._validate_can_delete(allow_delete_locked=allow_delete_locked)
+
+        if self._is_link(self.pin_p, 11008):
+            os.unlink(self.pin_p)
+        if self._is_link(self.attr_pin_p, 11102):
+            os.unlink(self.attr_pin_p)
+
+        self.unlock()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _validate_can_delete(self,
+                             allow_delete_locked):
+        """
+        Raises an error if the pin is locked and locked pins may not be deleted.
+
+        :param allow_delete_locked:
+                If True, then the link may be deleted, even if it is locked.
+
+        :return:
+                Nothing.
+        """
+
         if not allow_delete_locked and self.is_locked():
             err_msg = self.localized_resource_obj.get_error_msg(11106)
             err_msg = err_msg.format(pin=self.pin_p)
             raise SquirrelError(err_msg, 11106)
 
-        if os.path.exists(os.path.abspath(self.pin_p)):
-            if not os.path.islink(self.pin_p):
-                err_msg = self.localized_resource_obj.get_error_msg(11008)
-                err_msg = err_msg.format(pin=self.pin_p)
-                raise SquirrelError(err_msg, 11008)
-            os.unlink(self.pin_p)
+    # ------------------------------------------------------------------------------------------------------------------
+    def _is_link(self,
+                 link_p,
+                 err_code) -> bool:
+        """
+        Returns whether there is a symlink at link_p. A single lstat is used so that dangling links (which
+        os.path.exists reports as missing) are found too.
 
-        if os.path.exists(self.attr_pin_p):
-            if not os.path.islink(self.attr_pin_p):
-                err_msg = self.localized_resource_obj.get_error_msg(11102)
-                err_msg = err_msg.format(pin=self.attr_pin_p)
-                raise SquirrelError(err_msg, 11102)
-            os.unlink(self.attr_pin_p)
+        :param link_p:
+                The path to check.
+        :param err_code:
+                The error to raise if link_p exists but is not a symlink.
 
-        self.unlock()
+        :return:
+                True if there is a symlink at link_p, False if there is nothing there.
+        """
+
+        try:
+            st = os.lstat(link_p)
+        except FileNotFoundError:
+            return False
+
+        if not stat.S_ISLNK(st.st_mode):
+            err_msg = self.localized_resource_obj.get_error_msg(err_code)
+            err_msg = err_msg.format(pin=link_p)
+            raise SquirrelError(err_msg, err_code)
+
+        return True
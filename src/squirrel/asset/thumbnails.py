@@ -1,6 +1,5 @@
 import os
-import pathlib
-import re
+import stat
 from typing import Union
 
 from bvzlocalization import LocalizedResource
@@ -59,12 +58,15 @@ class Thumbnails(object):
 
         for thumbnail in thumbnail_paths:
 
-            if not os.path.exists(thumbnail):
+            # A single stat answers both "does it exist" and "is it a directory"
+            try:
+                thumbnail_stat = os.stat(thumbnail)
+            except OSError:
                 err_msg = self.localized_resource_obj.get_error_msg(11209)
                 err_msg = err_msg.format(path=thumbnail)
                 raise SquirrelError(err_msg, 11209)
 
-            if os.path.isdir(thumbnail):
+            if stat.S_ISDIR(thumbnail_stat.st_mode):
                 err_msg = self.localized_resource_obj.get_error_msg(11300)
                 raise SquirrelError(err_msg, 11300)
 
@@ -85,39 +87,41 @@ class Thumbnails(object):
                 The list of full paths to the thumbnail files.
 
         :return:
-                Nothing.
+                The full path to the first frame (frame 1). None if the list of thumbnails is empty.
         """
 
         assert type(thumbnail_paths) is list
         for thumbnail_path in thumbnail_paths:
             assert type(thumbnail_path) is str
 
-        pattern = r"(.+)\.([0-9]+)\.(.+)"
-
         frame_numbers = list()
+        first_frame_p = None
+        prefix = self.asset_n + "."
 
         for thumbnail_p in thumbnail_paths:
 
-            thumbnail_n = os.path.split(thumbnail_p)[1]
-            result = re.match(pattern, thumbnail_n)
+            thumbnail_n = os.path.basename(thumbnail_p)
+            frame_str, _, ext = thumbnail_n[len(prefix):].partition(".")
 
-            if result is None:
+            if (not thumbnail_n.startswith(prefix)
+                    or not (frame_str.isascii() and frame_str.isdigit())
+                    or not ext):
                 err_msg = self.localized_resource_obj.get_error_msg(11006)
                 err_msg = err_msg.format(thumbnail_file=thumbnail_n, basename=self.asset_n)
                 raise SquirrelError(err_msg, 11006)
 
-            if result.groups()[0] != self.asset_n:
-                err_msg = self.localized_resource_obj.get_error_msg(11006)
-                err_msg = err_msg.format(thumbnail_file=thumbnail_n, basename=self.asset_n)
-                raise SquirrelError(err_msg, 11006)
-
-            frame_numbers.append(int(result.groups()[1]))
+            frame_number = int(frame_str)
+            if frame_number == 1:
+                first_frame_p = thumbnail_p
+            frame_numbers.append(frame_number)
 
         frame_numbers.sort()
         if frame_numbers != list(range(1, len(frame_numbers) + 1)):
             err_msg = self.localized_resource_obj.get_error_msg(11301)
             raise SquirrelError(err_msg, 11301)
 
+        return first_frame_p
+
     # ------------------------------------------------------------------------------------------------------------------
     def set_poster_frame(self,
                          poster_p):
@@ -177,7 +181,7 @@ class Thumbnails(object):
         assert poster_p is None or type(poster_p) is str
 
         self._verify_thumbnail_paths(thumbnail_paths=thumbnail_paths)
-        self._verify_thumbnail_names(thumbnail_paths=thumbnail_paths)
+        first_frame_p = self._verify_thumbnail_names(thumbnail_paths=thumbnail_paths)
 
         try:
             copydescriptors = bvzversionedfiles.file_list_to_copydescriptors(items=thumbnail_paths,
@@ -194,7 +198,11 @@ class Thumbnails(object):
                                                   num_digits=4,
                                                   do_verified_copy=False)
 
-        self.set_poster_frame(poster_p=poster_p)
+        if poster_p is None:
+            poster_p = first_frame_p
+
+        if poster_p is not None:
+            self.set_poster_frame(poster_p=poster_p)
 
     # ------------------------------------------------------------------------------------------------------------------
     def delete_poster(self):
@@ -205,10 +213,10 @@ class Thumbnails(object):
                 Nothing.
         """
 
-        files_n = os.listdir(self.thumbnail_d)
-        for file_n in files_n:
-            if os.path.splitext(file_n)[0].lower() == "poster":
-                os.unlink(os.path.join(self.thumbnail_d, file_n))
+        with os.scandir(self.thumbnail_d) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[0].lower() == "poster":
+                    os.unlink(entry.path)
 
     # ------------------------------------------------------------------------------------------------------------------
     def delete_thumbnails(self,
@@ -217,23 +225,26 @@ class Thumbnails(object):
         Deletes the thumbnails and poster frame.
 
         :param files_to_keep:
-                A list of files NOT to delete.
+                A set of files NOT to delete.
 
         :return:
                 Nothing.
         """
 
-        assert type(files_to_keep) is list
+        assert type(files_to_keep) is set
         for file_to_keep in files_to_keep:
             assert type(file_to_keep) is str
-        target_files_to_delete = self.thumbnail_data_files()
 
-        for delete_target in target_files_to_delete:
+        # List the thumbnail links once, and remove each link's data file (unless it is still in use) and then the link
+        # itself as we go. Identical frames share a data file, so it may already be gone by the time a later link is
+        # reached.
+        for symlink_file_to_delete in self.thumbnail_symlink_files():
+            delete_target = os.path.realpath(symlink_file_to_delete)
             if delete_target not in files_to_keep:
-                os.remove(delete_target)
-
-        symlink_files_to_delete = self.thumbnail_symlink_files()
-        for symlink_file_to_delete in symlink_files_to_delete:
+                try:
+                    os.remove(delete_target)
+                except FileNotFoundError:
+                    pass
             os.unlink(symlink_file_to_delete)
 
         self.delete_poster()
@@ -249,12 +260,14 @@ class Thumbnails(object):
 
         output = list()
 
-        files_n = os.listdir(self.thumbnail_d)
-        for file_n in files_n:
-            if os.path.splitext(os.path.splitext(file_n)[0])[0] == self.asset_n:
-                link_p = os.path.join(self.thumbnail_d, file_n)
-                if os.path.islink(link_p):
-                    output.append(os.path.join(self.thumbnail_d, file_n))
+        # Thumbnails are always named asset_name.###.ext, so a prefix test picks them out of the thumbnail dir without
+        # splitting every name apart.
+        prefix = self.asset_n + "."
+
+        with os.scandir(self.thumbnail_d) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.is_symlink():
+                    output.append(entry.path)
 
         return output
 
@@ -267,13 +280,7 @@ class Thumbnails(object):
                 A list of all of the thumbnail files.
         """
 
-        output = list()
-
-        links_p = self.thumbnail_symlink_files()
-        for link_p in links_p:
-            output.append(str(pathlib.Path(link_p).resolve()))
-
-        return output
+        return [os.path.realpath(link_p) for link_p in self.thumbnail_symlink_files()]
 
     # ------------------------------------------------------------------------------------------------------------------
     def poster_file(self) -> str:
@@ -284,10 +291,8 @@ class Thumbnails(object):
                 A path to the poster file. If no poster frame is found, returns a blank.
         """
 
-        files_n = os.listdir(self.thumbnail_d)
-        for file_n in files_n:
-            if os.path.splitext(file_n)[0].lower() == "poster":
-                link_p = os.path.join(self.thumbnail_d, file_n)
-                if os.path.islink(link_p):
-                    return os.path.join(self.thumbnail_d, link_p)
+        with os.scandir(self.thumbnail_d) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[0].lower() == "poster" and entry.is_symlink():
+                    return entry.path
         return ""
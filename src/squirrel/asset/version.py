@@ -1,4 +1,3 @@
-import errno
 import os
 import shutil
 
@@ -54,7 +53,10 @@ class Version(object):
 
         self.asset_n = asset_n
         self.asset_d = asset_d
-        self._validate_asset_d()
+
+        # An existing version implies an existing asset dir, so only check the asset dir on its own for new versions.
+        if not must_exist:
+            self._validate_asset_d()
 
         self.version_int = version_int
         self._validate_max_version_value()
@@ -67,11 +69,12 @@ class Version(object):
         if must_exist:
             self._validate_exists()
 
-        thumbnail_d = os.path.join(self.version_metadata_d, "thumbnails")
+        self.notes_p = os.path.join(self.version_metadata_d, "notes")
+        self.thumbnail_d = os.path.join(self.version_metadata_d, "thumbnails")
         thumbnail_data_d = os.path.join(self.asset_d, ".thumbnaildata")
 
         self.thumbnails = Thumbnails(asset_n=self.asset_n,
-                                     thumbnail_d=thumbnail_d,
+                                     thumbnail_d=self.thumbnail_d,
                                      thumbnail_data_d=thumbnail_data_d,
                                      localized_resource_obj=self.localized_resource_obj)
 
@@ -109,6 +112,7 @@ class Version(object):
         """
 
         if not self.exists():
+            self._validate_asset_d()  # Report a missing asset dir (vs. a missing version) if that is the real cause
             err_msg = self.localized_resource_obj.get_error_msg(11000)
             err_msg = err_msg.format(version=self.version_str)
             raise SquirrelError(err_msg, 11000)
@@ -139,14 +143,11 @@ class Version(object):
         """
 
         try:
-            os.mkdir(self.version_d)
-        except OSError as e:
-            if e.errno == errno.EEXIST and os.path.isdir(self.version_d):
-                return
-            else:
-                err_msg = self.localized_resource_obj.get_error_msg(1234)
-                err_msg = err_msg.format(version_p=self.version_d)
-                raise SquirrelError(err_msg, 1234)
+            os.makedirs(self.version_d, exist_ok=True)
+        except OSError:
+            err_msg = self.localized_resource_obj.get_error_msg(1234)
+            err_msg = err_msg.format(version_p=self.version_d)
+            raise SquirrelError(err_msg, 1234)
 
     # ------------------------------------------------------------------------------------------------------------------
     def _create_metadata_dir(self):
@@ -158,14 +159,11 @@ class Version(object):
         """
 
         try:
-            os.mkdir(self.version_metadata_d)
-        except OSError as e:
-            if e.errno == errno.EEXIST and os.path.isdir(self.version_metadata_d):
-                return
-            else:
-                err_msg = self.localized_resource_obj.get_error_msg(1234)
-                err_msg = err_msg.format(metadata_p=self.version_metadata_d)
-                raise SquirrelError(err_msg, 1234)
+            os.makedirs(self.version_metadata_d, exist_ok=True)
+        except OSError:
+            err_msg = self.localized_resource_obj.get_error_msg(1234)
+            err_msg = err_msg.format(metadata_p=self.version_metadata_d)
+            raise SquirrelError(err_msg, 1234)
 
     # ------------------------------------------------------------------------------------------------------------------
     def _create_thumbnails_dir(self):
@@ -177,14 +175,11 @@ class Version(object):
         """
 
         try:
-            os.mkdir(os.path.join(self.version_metadata_d, "thumbnails"))
-        except OSError as e:
-            if e.errno == errno.EEXIST and os.path.isdir(self.version_metadata_d):
-                return
-            else:
-                err_msg = self.localized_resource_obj.get_error_msg(1234)
-                err_msg = err_msg.format(metadata_p=self.version_metadata_d)
-                raise SquirrelError(err_msg, 1234)
+            os.makedirs(self.thumbnail_d, exist_ok=True)
+        except OSError:
+            err_msg = self.localized_resource_obj.get_error_msg(1234)
+            err_msg = err_msg.format(metadata_p=self.version_metadata_d)
+            raise SquirrelError(err_msg, 1234)
 
     # ------------------------------------------------------------------------------------------------------------------
     def create_dirs(self):
@@ -217,8 +212,7 @@ class Version(object):
         assert type(notes) is str
         assert type(overwrite) is bool
 
-        notes_p = os.path.join(self.version_metadata_d, "notes")
-        libtext.write_to_text_file(notes_p, notes, overwrite)
+        libtext.write_to_text_file(self.notes_p, notes, overwrite)
 
     # ------------------------------------------------------------------------------------------------------------------
     def delete_notes(self):
@@ -229,9 +223,10 @@ class Version(object):
                 Nothing.
         """
 
-        notes_p = os.path.join(self.version_metadata_d, "notes")
-        if os.path.exists(notes_p):
-            os.remove(notes_p)
+        try:
+            os.remove(self.notes_p)
+        except FileNotFoundError:
+            pass
 
     # ------------------------------------------------------------------------------------------------------------------
     def list_notes(self) -> str:
@@ -244,12 +239,9 @@ class Version(object):
 
         output = ""
 
-        notes_p = os.path.join(self.version_metadata_d, "notes")
-        if os.path.exists(notes_p):
-            with open(notes_p, "r") as f:
-                lines = f.readlines()
-            output = [line.rstrip() for line in lines]
-            output = "\n".join(output)
+        if os.path.exists(self.notes_p):
+            with open(self.notes_p, "r") as f:
+                output = "\n".join([line.rstrip() for line in f.read().splitlines()])
 
         return output
 
@@ -286,13 +278,13 @@ class Version(object):
         Deletes the thumbnails and poster frame.
 
         :param files_to_keep:
-                A list of thumbnail files NOT to delete.
+                A set of thumbnail files NOT to delete.
 
         :return:
                 Nothing.
         """
 
-        assert type(files_to_keep) is list
+        assert type(files_to_keep) is set
         for file_to_keep in files_to_keep:
             assert type(file_to_keep) is str
 
@@ -358,25 +350,40 @@ class Version(object):
     def delete_version(self,
                        files_to_keep):
         """
-        Deletes the current version. Needs a list of files in the .data directory that should not be deleted (because
+        Deletes the current version. Needs a set of files in the .data directory that should not be deleted (because
         these files are also referenced by another version).
 
         :param files_to_keep:
-                A list of files in the data directory that we do NOT want to delete. Essentially this would be a list of
-                files that are in the other versions.
+                A set of files in the data directory that we do NOT want to delete. Essentially this would be the files
+                that are in the other versions.
 
         :return:
                 Nothing.
         """
 
-        assert type(files_to_keep) is list
+        assert type(files_to_keep) is set
         for file_to_keep in files_to_keep:
             assert type(file_to_keep) is str
 
         files_to_potentially_delete = self.user_data_files()
         for file_to_potentially_delete in files_to_potentially_delete:
             if file_to_potentially_delete not in files_to_keep:
-                os.remove(file_to_potentially_delete)
+                try:
+                    os.remove(file_to_potentially_delete)
+                except FileNotFoundError:
+                    pass
+
+        self.delete_dirs()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def delete_dirs(self):
+        """
+        Deletes the version directory and meta directory from disk. Does not touch the files in the .data directory
+        that the version references.
+
+        :return:
+                Nothing.
+        """
 
         shutil.rmtree(self.version_d, ignore_errors=True)
         shutil.rmtree(self.version_metadata_d, ignore_errors=True)
@@ -1,4 +1,3 @@
-import inspect
 import os
 import sqlite3
 
@@ -62,13 +61,11 @@ class Cache(object):
                 A path to the directory in which cache files are stored.
         """
 
-        if constants.CACHE_PATH_ENV_VAR in os.environ.keys():
-            cache_d = os.environ[constants.CACHE_PATH_ENV_VAR]
-        elif self.config_obj.get_string("repo_settings", "cache_dir") != "":
+        cache_d = os.environ.get(constants.CACHE_PATH_ENV_VAR)
+        if cache_d is None:
             cache_d = self.config_obj.get_string("repo_settings", "cache_dir")
-        else:
-            module_d = os.path.split(inspect.stack()[0][1])[0]
-            cache_d = os.path.join(module_d, "..", "..", "..", "cache")
+            if cache_d == "":
+                cache_d = constants.DEFAULT_CACHE_D
 
         if not os.path.isdir(cache_d):
             err_msg = self.localized_resource_obj.get_error_msg(800)
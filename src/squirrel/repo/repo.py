@@ -1,6 +1,6 @@
-import configparser
 import os
 import pathlib
+import stat
 
 import bvzversionedfiles.bvzversionedfiles as bvzversionedfiles
 
@@ -109,7 +109,11 @@ class Repo(object):
         self.repo_root_d = repo_root_d
         self._validate_repo_root_d()
 
-        self.repo_n = os.path.split(repo_root_d.rstrip(os.sep))[1]
+        self.repo_n = os.path.basename(repo_root_d.rstrip(os.sep))
+
+        # Precomputed so that containment tests are a single prefix comparison that cannot match a sibling directory
+        # whose name merely starts with the repo name (i.e. /show/repo vs. /show/repo_old).
+        self.repo_root_prefix = repo_root_d.rstrip(os.sep) + os.sep
 
         self.localized_resource_obj = localized_resource_obj
         self.config_obj = config_obj
@@ -153,7 +157,7 @@ class Repo(object):
                 True if it is anywhere within the repo. False otherwise.
         """
 
-        return path_p.startswith(self.repo_root_d)
+        return path_p.startswith(self.repo_root_prefix) or path_p == self.repo_root_prefix[:-1]
 
     # ------------------------------------------------------------------------------------------------------------------
     def _path_is_part_of_repo_structure(self,
@@ -180,26 +184,29 @@ class Repo(object):
                 True if it is a valid directory within the current repo, False otherwise.
         """
 
-        if not os.path.exists(path_p):
-            return False
-
-        if not os.path.isdir(path_p):
-            return False
-
         if not self._path_is_within_repo(path_p):
             return False
 
-        if (not os.path.exists(os.path.join(path_p, ".repo")) and
-                not os.path.exists(os.path.join(path_p, ".repo_root"))):
+        # A single stat answers both "does it exist" and "is it a directory".
+        try:
+            path_stat = os.stat(path_p)
+        except OSError:
             return False
 
-        if os.path.isdir(os.path.join(path_p, ".repo")):
+        if not stat.S_ISDIR(path_stat.st_mode):
             return False
 
-        if os.path.isdir(os.path.join(path_p, ".repo_root")):
-            return False
+        semaphore_found = False
+        for semaphore_n in (".repo", ".repo_root"):
+            try:
+                semaphore_stat = os.stat(os.path.join(path_p, semaphore_n))
+            except OSError:
+                continue
+            if stat.S_ISDIR(semaphore_stat.st_mode):
+                return False
+            semaphore_found = True
 
-        return True
+        return semaphore_found
 
     # ------------------------------------------------------------------------------------------------------------------
     def _uri_path_is_valid(self,
@@ -349,33 +356,52 @@ class Repo(object):
         assert type(dir_p) is str
         assert type(root) is bool
 
-        if not os.path.exists(dir_p):
+        try:
+            self._bless_existing_dir(dir_p, root)
+        except FileNotFoundError:
             err_msg = self.localized_resource_obj.get_error_msg(100)
             err_msg = err_msg.format(dir=dir_p)
             raise SquirrelError(err_msg, 100)
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def _bless_existing_dir(self,
+                            dir_p,
+                            root=False):
+        """
+        Blesses a directory that is already known to exist (for example, one that was just found by scanning its
+        parent). Identical to _bless_dir except that a missing directory raises a FileNotFoundError instead of a
+        SquirrelError.
+
+        :param dir_p:
+                The full path to the directory being blessed.
+        :param root:
+                If True, then this is a root dir, otherwise it is a normal structure dir.
+
+        :return:
+                Nothing.
+        """
+
+        assert type(dir_p) is str
+        assert type(root) is bool
+
         if root:
             semaphore_p = os.path.join(dir_p, ".repo_root")
         else:
             semaphore_p = os.path.join(dir_p, ".repo")
 
-        if os.path.isdir(semaphore_p):
+        # Opening the semaphore for writing truncates any existing file, so there is no need to check for or remove it
+        # first. If the semaphore path is a directory, the open itself fails.
+        try:
+            with open(semaphore_p, "w") as f:
+                if root:
+                    # A single-key ini file. Written directly (in the same format ConfigParser would write) rather
+                    # than building a ConfigParser object just to serialize one value.
+                    f.write(f"[settings]\nrepo_name = {self.repo_n}\n\n")
+        except IsADirectoryError:
             err_msg = self.localized_resource_obj.get_error_msg(101)
             err_msg = err_msg.format(file_path=semaphore_p)
             raise SquirrelError(err_msg, 101)
 
-        if os.path.exists(semaphore_p):
-            os.remove(semaphore_p)
-
-        if root:
-            semaphore_obj = configparser.ConfigParser()
-            semaphore_obj.add_section("settings")
-            semaphore_obj.set("settings", "repo_name", self.repo_n)
-            with open(semaphore_p, "w") as f:
-                semaphore_obj.write(f)
-        else:
-            open(semaphore_p, "w").close()
-
     # ------------------------------------------------------------------------------------------------------------------
     def _bless_root(self):
         """
@@ -396,26 +422,24 @@ class Repo(object):
         :return: Nothing.
         """
 
-        root = True
-        for dir_d, dirs_n, files_n in os.walk(self.repo_root_d):
+        self._bless_root()
 
-            if root:
-                self._bless_root()
-                root = False
-            else:
-                self._bless_dir(dir_d, False)
+        # Walk the hierarchy with a single scandir per directory, reusing the directory entries (and their cached
+        # type information) instead of re-statting each child.
+        dirs_d = [self.repo_root_d]
+        while dirs_d:
+            dir_d = dirs_d.pop()
+            with os.scandir(dir_d) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
 
-            # Skip any sub-dirs are assets by removing them from the list of sub-dirs to descend into
-            del_dirs_n = list()
-            for dir_n in dirs_n:
-                test_asset_obj = Asset(asset_parent_d=dir_d,
-                                       name=dir_n,
-                                       config_obj=self.config_obj,
-                                       localized_resource_obj=self.localized_resource_obj)
-                if test_asset_obj.is_asset():
-                    del_dirs_n.append(dir_n)
-            for del_n in del_dirs_n:
-                dirs_n.remove(del_n)
+                    # Skip any sub-dirs that are assets so that we do not descend into them
+                    if os.path.exists(os.path.join(entry.path, ".asset")):
+                        continue
+
+                    self._bless_existing_dir(entry.path, False)
+                    dirs_d.append(entry.path)
 
     # ------------------------------------------------------------------------------------------------------------------
     def list_asset_objs_from_filesystem(self):
@@ -428,19 +452,36 @@ class Repo(object):
 
         output = list()
 
-        for dir_d, dirs_n, files_n in os.walk(self.repo_root_d):
-            if os.path.exists(os.path.join(dir_d, ".repo")):
-                continue
-            if os.path.exists(os.path.join(dir_d, ".repo_root")):
+        # A single scandir per directory answers both "is this an asset/repo dir" (from the entry names) and "which
+        # sub-dirs do we descend into" (from the cached entry types) without any additional stat calls.
+        dirs_d = [self.repo_root_d]
+        while dirs_d:
+            dir_d = dirs_d.pop()
+
+            # Like os.walk, skip directories that cannot be read (or that were removed since they were listed) rather
+            # than failing the whole listing.
+            items_n = set()
+            sub_dirs_d = list()
+            try:
+                with os.scandir(dir_d) as entries:
+                    for entry in entries:
+                        items_n.add(entry.name)
+                        if entry.is_dir(follow_symlinks=False):
+                            sub_dirs_d.append(entry.path)
+            except OSError:
                 continue
-            parent_d, name = os.path.split(dir_d)
-            asset_obj = Asset(asset_parent_d=parent_d,
-                              name=name,
-                              config_obj=self.config_obj,
-                              localized_resource_obj=self.localized_resource_obj)
-            if asset_obj.is_asset():
+
+            if ".repo" not in items_n and ".repo_root" not in items_n and ".asset" in items_n:
+                parent_d, name = os.path.split(dir_d)
+                asset_obj = Asset(asset_parent_d=parent_d,
+                                  name=name,
+                                  config_obj=self.config_obj,
+                                  localized_resource_obj=self.localized_resource_obj)
                 output.append(asset_obj)
-                dirs_n[:] = []  # Empty out the dirs_n list so that we don't go any deeper down this directory branch
+                continue  # Don't go any deeper down this directory branch
+
+            # Reversed so that the directories are popped (and the assets listed) in the same order as os.walk
+            dirs_d.extend(reversed(sub_dirs_d))
 
         return output
 
@@ -3,6 +3,7 @@ The RepoManager class is the entry point for all actions related to repositories
 responsible for passing requests from the rest of asset management system to the individual repos.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 from squirrel.repo.repo import Repo
@@ -48,6 +49,9 @@ class RepoManager(object):
                                                            localized_resource_obj=self.localized_resource_obj,
                                                            config_p=config_p)
 
+        self.warn_on_load_error = self.config_obj.get_boolean("repo_settings", "warn_on_load_error")
+        self.fail_on_load_error = self.config_obj.get_boolean("repo_settings", "fail_on_load_error")
+
         self.repo_list_obj = setuprepolist.create_repo_list_object(localized_resource_obj=self.localized_resource_obj,
                                                                    repo_list_p=repo_list_p)
 
@@ -326,30 +330,28 @@ class RepoManager(object):
             else:
                 return None
 
-        if not self._name_is_existing_repo(default_repo_name):
-            return None
-
-        if default_repo_name not in self.repos.keys():
+        try:
+            self.default_repo = self.repos[default_repo_name]
+        except KeyError:
             return None
 
-        self.default_repo = self.repos[default_repo_name]
-
     # ------------------------------------------------------------------------------------------------------------------
-    def _load_repo(self,
-                   repo_p):
+    def _new_repo_obj(self,
+                      repo_p):
         """
-        Loads a single repo given a path. If the path given does not point to a valid repo dir, an error will be raised.
+        Creates a single repo object given a path. If the path given does not point to a valid repo dir, an error will
+        be raised. Does not add the repo to the list of loaded repos.
 
         :param repo_p:
                 The path to the repo to load. The path must exist and must be a valid repo. Raises an error if not.
 
         :return:
-                Nothing.
+                A repo object.
         """
 
         assert type(repo_p) is str
 
-        if not os.path.exists(repo_p) or not os.path.isdir(repo_p):
+        if not os.path.isdir(repo_p):
             err_msg = self.localized_resource_obj.get_error_msg(302)
             err_msg = err_msg.format(repo_path=repo_p)
             raise SquirrelError(err_msg, 302)
@@ -364,7 +366,7 @@ class RepoManager(object):
             err_msg = err_msg.format(repo_path=repo_p)
             raise SquirrelError(err_msg, 301)
 
-        self.repos[repo_obj.repo_n] = repo_obj
+        return repo_obj
 
     # ------------------------------------------------------------------------------------------------------------------
     def _load_repos(self,
@@ -382,25 +384,53 @@ class RepoManager(object):
 
         assert type(repos) is list
 
-        warn_on_load_error = self.config_obj.get_boolean("repo_settings", "warn_on_load_error")
-        fail_on_load_error = self.config_obj.get_boolean("repo_settings", "fail_on_load_error")
+        # Loading a repo is dominated by filesystem latency (which can be considerable on network storage), so when
+        # there are more than a couple of repos, validate them concurrently. The results are still processed in the
+        # original order so that the warn/fail behavior is identical to loading them one at a time.
+        futures = list()
+        if len(repos) > 2:
+            with ThreadPoolExecutor(max_workers=min(16, len(repos))) as executor:
+                for repo_path in repos:
+                    futures.append(executor.submit(self._new_repo_obj, repo_p=repo_path))
 
-        for repo_path in repos:
+        for i, repo_path in enumerate(repos):
             try:
-                self._load_repo(repo_p=repo_path)
+                if futures:
+                    repo_obj = futures[i].result()
+                else:
+                    repo_obj = self._new_repo_obj(repo_p=repo_path)
             except SquirrelError as e:
                 if e.code in [301, 302]:
-                    if fail_on_load_error:
+                    if self.fail_on_load_error:
                         err_msg = self.localized_resource_obj.get_error_msg(310)
                         err_msg = err_msg.format(message=str(e))
                         raise SquirrelError(err_msg, 310)
-                    if warn_on_load_error:  # <- rely on upstream to check the code and not actually quit.
+                    if self.warn_on_load_error:  # <- rely on upstream to check the code and not actually quit.
                         err_msg = self.localized_resource_obj.get_error_msg(311)
                         err_msg = err_msg.format(message=str(e))
                         raise SquirrelError(err_msg, 311)
+                    continue
                 else:
                     raise
 
+            self.repos[repo_obj.repo_n] = repo_obj
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _repos_from_repo_list_file(self):
+        """
+        Reads the repos section of the repo list file.
+
+        :return:
+                A dictionary where the key is the repo name and the value is the path to the repo, in the order they are
+                listed in the repo list file.
+        """
+
+        output = dict()
+        for repo_n in self.repo_list_obj.options("repos"):
+            output[repo_n] = self.repo_list_obj.get_string("repos", repo_n)
+
+        return output
+
     # ------------------------------------------------------------------------------------------------------------------
     def _load_repos_from_repos_list(self):
         """
@@ -411,10 +441,7 @@ class RepoManager(object):
                 Nothing.
         """
 
-        repo_names = self.repo_list_obj.options("repos")
-        repos_p = list()
-        for repo_name in repo_names:
-            repos_p.append(self.repo_list_obj.get_string("repos", repo_name))
+        repos_p = list(self._repos_from_repo_list_file().values())
 
         try:
             self._load_repos(repos_p)
@@ -490,15 +517,42 @@ class RepoManager(object):
 
         self.repo_list_obj.replace_section("defaults", {"default_repo": self.default_repo.repo_n})
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def _repo_list_file_is_current(self):
+        """
+        Checks whether the repo list file already matches the current state of all loaded repos (and the default repo).
+
+        :return:
+                True if saving the repo list file would not change it. False otherwise.
+        """
+
+        listed_repos = self._repos_from_repo_list_file()
+
+        loaded_repos = dict()
+        for key, value in self.repos.items():
+            loaded_repos[key] = value.repo_root_d
+
+        if listed_repos != loaded_repos:
+            return False
+
+        if self.default_repo is None or not self.repo_list_obj.has_option("defaults", "default_repo"):
+            return False
+
+        return self.repo_list_obj.get_string("defaults", "default_repo") == self.default_repo.repo_n
+
     # ------------------------------------------------------------------------------------------------------------------
     def save_repo_list_file(self):
         """
-        Saves the repo list file with all of the changes made during the current session (by add_repo, make_repo).
+        Saves the repo list file with all of the changes made during the current session (by add_repo, make_repo). If
+        nothing has changed, the file is not rewritten.
 
         :return:
                 Nothing.
         """
 
+        if self._repo_list_file_is_current():
+            return
+
         self._update_repo_list_file(purge=True)
         self.repo_list_obj.save()
 
@@ -619,14 +673,9 @@ class RepoManager(object):
                 where this repo should have been.
         """
 
-        repo_names = self.repo_list_obj.options("repos")
-
-        output = dict()
-        for repo_name in repo_names:
-            if repo_name not in self.repos.keys():
-                output[repo_name] = self.repo_list_obj.get_string("repos", repo_name)
+        listed_repos = self._repos_from_repo_list_file()
 
-        return output
+        return {repo_n: repo_p for repo_n, repo_p in listed_repos.items() if repo_n not in self.repos}
 
     # ------------------------------------------------------------------------------------------------------------------
     def set_default_repo(self,
@@ -648,7 +697,7 @@ class RepoManager(object):
             err_msg = err_msg.format(repo_name=repo_n)
             raise SquirrelError(err_msg, 102)
 
-        self.default_repo = self.repos[repo_n].repo_n
+        self.default_repo = self.repos[repo_n]
 
     # ------------------------------------------------------------------------------------------------------------------
     def cache_repo(self,
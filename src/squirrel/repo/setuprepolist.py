@@ -1,4 +1,3 @@
-import inspect
 import os
 
 from bvzconfig import Config
@@ -22,11 +21,7 @@ def validate_repo_list(repo_list_obj,
            Nothing.
     """
 
-    sections = dict()
-    sections["repos"] = None
-    sections["defaults"] = [("default_repo", "str")]
-
-    failures = repo_list_obj.validate(sections)
+    failures = repo_list_obj.validate(REPO_LIST_SECTIONS)
     if failures:
         if failures[1] is None:
             err_msg = localized_resource_obj.get_error_msg(601)
@@ -55,11 +50,9 @@ def create_repo_list_object(localized_resource_obj,
     assert repo_list_p is None or type(repo_list_p) is str
 
     if repo_list_p is None:
-        if REPO_LIST_PATH_ENV_VAR in os.environ.keys():
-            repo_list_p = os.environ[REPO_LIST_PATH_ENV_VAR]
-        else:
-            module_d = os.path.split(inspect.stack()[0][1])[0]
-            repo_list_p = os.path.join(module_d, "..", "..", "..", "config", "repos")
+        repo_list_p = os.environ.get(REPO_LIST_PATH_ENV_VAR)
+        if repo_list_p is None:
+            repo_list_p = DEFAULT_REPO_LIST_P
 
     if not os.path.exists(repo_list_p):
         err_msg = localized_resource_obj.get_error_msg(603)
@@ -1,3 +1,6 @@
+import os
+import re
+
 CONFIG_PATH_ENV_VAR = "SQUIRREL_CONFIG"
 CACHE_PATH_ENV_VAR = "SQUIRREL_CACHE_PATH"
 REPO_LIST_PATH_ENV_VAR = "SQUIRREL_REPO_LIST"
@@ -7,6 +10,8 @@ DEFAULT_ASSET_PATH_ENV = "BVZASSET_DEFAULT_ASSET_PATH"
 BVZASSET_STRUCTURE_VERSION = "1.0"  # <- this should be updated whenever the structure of an asset is changed.
 VERSION_NUM_DIGITS = 4
 VERSION_PATTERN = r"^(v)([0-9]{" + str(VERSION_NUM_DIGITS) + "})$"
+VERSION_RE = re.compile(VERSION_PATTERN)
+RESERVED_PIN_NAMES = frozenset(("THUMBNAILDATA", "DATA"))  # <- names of asset dirs that a pin may not shadow.
 
 ASSET_CONFIG_SECTIONS = dict()
 ASSET_CONFIG_SECTIONS["skip list regex"] = None
@@ -20,5 +25,16 @@ REPO_CONFIG_SECTIONS["repo_settings"] = [("warn_on_load_error", "bool"),
                                          ("default_gather_loc", "str"),
                                          ("cache_dir", "str")]
 
+REPO_LIST_SECTIONS = dict()
+REPO_LIST_SECTIONS["repos"] = None
+REPO_LIST_SECTIONS["defaults"] = [("default_repo", "str")]
+
 COMMAND_LINE_CONFIG_SECTIONS = dict()
 COMMAND_LINE_CONFIG_SECTIONS["command_line_settings"] = [("default_fields", "str")]
+
+# Locations of the files that ship with squirrel. These are resolved once, at import time, relative to this module.
+SQUIRREL_ROOT_D = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+RESOURCES_D = os.path.join(SQUIRREL_ROOT_D, "resources")
+DEFAULT_CONFIG_P = os.path.join(SQUIRREL_ROOT_D, "config", "squirrel.config")
+DEFAULT_REPO_LIST_P = os.path.join(SQUIRREL_ROOT_D, "config", "repos")
+DEFAULT_CACHE_D = os.path.join(SQUIRREL_ROOT_D, "cache")
@@ -19,14 +19,15 @@ def write_to_text_file(file_p,
             Nothing.
     """
 
-    assert os.path.exists(os.path.split(file_p)[0])
+    assert os.path.exists(os.path.dirname(file_p))
     assert type(text) is str
     assert type(overwrite) is bool
 
-    if not overwrite and os.path.exists(file_p):
-        open_as = "a"
-    else:
+    # Appending creates the file if it does not exist yet.
+    if overwrite:
         open_as = "w"
+    else:
+        open_as = "a"
 
     with open(file_p, open_as) as f:
         f.write(text + "\n")
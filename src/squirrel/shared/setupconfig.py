@@ -1,4 +1,3 @@
-import inspect
 import os
 
 from bvzconfig import Config
@@ -99,11 +98,9 @@ def create_config_object(validation_dict,
     assert type(validation_dict) is dict
 
     if config_p is None:
-        if CONFIG_PATH_ENV_VAR in os.environ.keys():
-            config_p = os.environ[CONFIG_PATH_ENV_VAR]
-        else:
-            module_d = os.path.split(inspect.stack()[0][1])[0]
-            config_p = os.path.abspath(os.path.join(module_d, "..", "..", "..", "config", "squirrel.config"))
+        config_p = os.environ.get(CONFIG_PATH_ENV_VAR)
+        if config_p is None:
+            config_p = DEFAULT_CONFIG_P
 
     if not os.path.exists(config_p):
         err_msg = localized_resource_obj.get_error_msg(503)
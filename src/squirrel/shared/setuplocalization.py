@@ -1,15 +1,18 @@
-import inspect
-import os.path
+import functools
 import sys
 
 from bvzlocalization import LocalizedResource
 from bvzlocalization import LocalizationError
 
+from squirrel.shared import constants
+
 
 # ----------------------------------------------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
 def create_localization_object(language):
     """
-    Create a localization object.
+    Create a localization object. The resource file is only parsed once per language, every subsequent call returns
+    the same (read-only) object.
 
     :param language:
             The language to use for this resource.
@@ -18,10 +21,8 @@ def create_localization_object(language):
             A localization object.
     """
 
-    module_d = os.path.split(inspect.stack()[0][1])[0]
-    resources_d = os.path.join(module_d, "..", "..", "..", "resources")
     try:
-        return LocalizedResource(resources_d, "squirrel", language)
+        return LocalizedResource(constants.RESOURCES_D, "squirrel", language)
     except LocalizationError as err:
         print(err.message)
         sys.exit(err.code)
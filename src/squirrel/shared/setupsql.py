@@ -1,7 +1,8 @@
-import inspect
 import configparser
 import os.path
 
+from squirrel.shared import constants
+
 
 # ----------------------------------------------------------------------------------------------------------------------
 def create_sql_object():
@@ -12,10 +13,7 @@ def create_sql_object():
             A sql resources object.
     """
 
-    module_d = os.path.split(inspect.stack()[0][1])[0]
-    resources_d = os.path.abspath(os.path.join(module_d, "..", "..", "..", "resources"))
-
     parser = configparser.ConfigParser()
-    parser.read(os.path.join(resources_d, "sql.ini"))
+    parser.read(os.path.join(constants.RESOURCES_D, "sql.ini"))
 
     return parser
@@ -5,10 +5,13 @@ class SquirrelError(Exception):
 
     def __init__(self, message, errno=0):
 
-        super(SquirrelError, self).__init__()
+        super(SquirrelError, self).__init__(message)
 
         self.code = errno
-        self.message = message
+
+    @property
+    def message(self):
+        return self.args[0] if self.args else ""
 
     @property
     def errno(self):
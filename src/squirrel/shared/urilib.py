@@ -2,6 +2,8 @@ import os
 import pathlib
 import re
 
+URI_RE = re.compile(r'.*:\/.*#.*')
+
 
 # ----------------------------------------------------------------------------------------------------------------------
 def validate_uri_format(uri):
@@ -16,8 +18,7 @@ def validate_uri_format(uri):
             True if the uri is valid. False otherwise.
     """
 
-    pattern = r'.*:\/.*#.*'
-    result = re.match(pattern=pattern, string=uri)
+    result = URI_RE.match(uri)
     if result:
         return True
     return False